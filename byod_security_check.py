@@ -27,21 +27,23 @@ try:
     import subprocess
     import re
     import json
-    import urllib.request
     import urllib.parse
-    import urllib.error
+    import http.client
     import base64
+    import email.utils
     import datetime
-    import webbrowser
+    import uuid
+    import importlib.util
     import time
-    import tempfile
     import shutil
+    import socket
     import threading
+    import functools
+    import configparser
+    import plistlib
+    from concurrent.futures import ThreadPoolExecutor
     import http.server
-    import socketserver
-    from http.server import BaseHTTPRequestHandler
-    from urllib.parse import urlparse
-    from typing import Dict, Tuple, Optional
+    from typing import Dict, List, Tuple, Optional, Union
 except ImportError as e:
     print(f"Error importing required modules: {e}")
     print("This script requires Python 3.6+ with standard library modules.")
@@ -51,27 +53,352 @@ except ImportError as e:
 # Check for common import mistakes and provide helpful error messages
 def check_for_common_import_issues():
     """Check for common import issues and provide helpful messages."""
-    # Check if someone accidentally added requests import
-    try:
-        # This will fail if requests is somehow being imported elsewhere
-        import requests
+    # Check if someone accidentally added requests import. Only look the
+    # module up rather than importing it, which would cost ~100ms at startup.
+    if importlib.util.find_spec('requests') is not None:
         print("WARNING: Found 'requests' module imported.")
         print("This script is designed to work WITHOUT external dependencies.")
         print("Using built-in urllib instead of requests for HTTP operations.")
-    except ImportError:
-        # This is expected - requests should not be imported
-        pass
 
 # Run the check
 check_for_common_import_issues()
 
 
-class AuthHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+# Known saas.group domains (main company + portfolio companies)
+_VALID_DOMAINS = frozenset({
+    'addsearch.co',
+    'addsearch.com',
+    'advancedshippingmanager.com',
+    'beekast.com',
+    'crosstalent-rh.fr',
+    'crosstalent.at',
+    'crosstalent.be',
+    'crosstalent.co.uk',
+    'crosstalent.com',
+    'crosstalent.de',
+    'crosstalent.eu',
+    'crosstalent.fr',
+    'crosstalent.it',
+    'crosstalent.nl',
+    'dashthis.com',
+    'getprerender.com',
+    'getrewardful.com',
+    'getscraperapi.com',
+    'getusersnap.com',
+    'gfconsulting.info',
+    'git-tower.com',
+    'gominga.com',
+    'infonline.de',
+    'juicer.io',
+    'keyword-rank-tracking.com',
+    'keyword.com',
+    'keyword.net',
+    'keyword.org',
+    'kingwebmaster.com',
+    'myworks.software',
+    'picdrop.com',
+    'picdrop.de',
+    'pipelinecrm.com',
+    'pipelinedeals.com',
+    'pipelinedealsco.com',
+    'pipelinesales.com',
+    'prerender.io',
+    'rewardful.com',
+    'rewardful.io',
+    'saas.blackfriday',
+    'saas.group',
+    'schumacher.me',
+    'scraperapi.cloud',
+    'scraperapi.co',
+    'scraperapi.com',
+    'scraperapi.io',
+    'seobility.net',
+    'timebutler.com',
+    'timebutler.de',
+    'tryprerender.com',
+    'tryrewardful.co',
+    'tryrewardful.com',
+    'tsventures.io',
+    'userewardful.com',
+    'usersnap.com',
+    'zenloop.com'
+})
+
+
+# platform.system().lower() -> method suffix of the platform-specific checks
+_PLAT_SUFFIX = {'darwin': 'macos', 'windows': 'windows', 'linux': 'linux'}
+
+
+# Pattern for parsing `system_profiler SPHardwareDataType` output in one pass;
+# group names match the device info keys
+_HARDWARE_RE = re.compile(
+    r'Model Name: (?P<model>.+)'
+    r'|Serial Number \(system\): (?P<serial>.+)'
+    r'|Memory: (?P<ram>.+)'
+)
+
+
+# Patterns for parsing screen lock settings in the autolock checks
+_DISPLAYSLEEP_RE = re.compile(r'displaysleep\s+(\d+)')
+_SCREENSAVE_TIMEOUT_RE = re.compile(r'ScreenSaveTimeOut\s+REG_SZ\s+(\d+)')
+_POWERCFG_AC_RE = re.compile(r'Current AC Power Setting Index: 0x([a-f0-9]+)')
+_KDE_TIMEOUT_RE = re.compile(r'Timeout=(\d+)')
+
+
+# Per-profile state in `netsh advfirewall show allprofiles state` output
+_NETSH_PROFILE_RE = re.compile(r'(Domain|Private|Public) Profile Settings:.*?State\s+(ON|OFF)',
+                               re.DOTALL | re.IGNORECASE)
+
+
+# A rule line in `iptables -L -n` output (not a chain or column header, not blank)
+_IPTABLES_RULE_RE = re.compile(r'^(?!Chain|target|\s*$).+', re.MULTILINE)
+
+
+# Overall state line in `ufw status` output
+_UFW_STATUS_RE = re.compile(r'Status:\s*(active|inactive)', re.IGNORECASE)
+
+
+# ANSI color codes for the banner gradient (orange to purple)
+_ORANGE = "\033[38;5;208m"  # Orange
+_RED_ORANGE = "\033[38;5;202m"  # Red-orange
+_RED = "\033[38;5;196m"  # Red
+_MAGENTA = "\033[38;5;198m"  # Magenta
+_PURPLE = "\033[38;5;135m"  # Purple
+_DARK_PURPLE = "\033[38;5;93m"  # Dark purple
+_RESET = "\033[0m"  # Reset color
+_BLACK = "\033[30m"  # Black for text
+
+# saas.group branded header, rendered once so it can be written in a single call
+_BANNER = (
+    "                                                                                                    \n"
+    "                                                                                                    \n"
+    "                                                                                                    \n"
+    "                                                                                                    \n"
+    f"                                       {_ORANGE}... .........................  ...{_RESET}                           \n"
+    f"                                       {_ORANGE}... .. ...........................{_RESET}                           \n"
+    f"                                        {_ORANGE}...... .........::::.............{_RESET}                           \n"
+    f"                                        {_ORANGE}... ......:-=============-:......{_RESET}                           \n"
+    f"                                  {_ORANGE}... .........:====================-:...  .{_RESET}                        \n"
+    f"                                {_RED_ORANGE}.............-========--:::::--=======-:.......{_RESET}                     \n"
+    f"                               {_RED_ORANGE}............:=======:.............:======-.......{_RESET}                    \n"
+    f"                               {_RED_ORANGE}..........:=======:....:--===--:....:======.......{_RESET}                   \n"
+    f"                        {_RED_ORANGE}. ... ..........=======:...:=============:...-=====......{_RESET}                   \n"
+    f"                       {_RED}...............-+=====:...:=================...-====-.....{_RESET}                   \n"
+    f"                       {_RED}.............-=+++++-...:======-:.....:-=====...-====:....{_RESET}                   \n"
+    f"                       {_RED}...........-=+++++-....-======:...:::...-====-..:====-....{_RESET}                   \n"
+    f"                       {_RED}.........:=+++++=:...-======:...:====-...=====...=====...{_RESET}                    \n"
+    f"                       {_RED}.......:=+++++=:...:======-...:======-...=====...=====....{_RESET}                   \n"
+    f"                       {_MAGENTA}......=++++++-...:======-....======-....=====-..:====-....{_RESET}                   \n"
+    f"                       {_MAGENTA}....-++++++-...:=======....-======:...-======...=====:....{_RESET}                   \n"
+    f"                       {_MAGENTA}...-+++++=...:=++++==:...-======:...:======-...-====-.....{_RESET}                   \n"
+    f"                       {_MAGENTA}...:+++=:...-+++++=:...:======-...:======-:...======.....{_RESET}                    \n"
+    f"                        {_MAGENTA}.........-+++++=-...:======-...:=======:...-=====-.....{_RESET}                     \n"
+    f"                       {_PURPLE}........:++++++=....=======:...-======-...:======-........{_RESET}                   \n"
+    f"                       {_PURPLE}......:++++++=....=======:...-======-...:=======..........{_RESET}                   \n"
+    f"                       {_PURPLE}....:=+++++=:...-======-...:======-...:=======:...........{_RESET}                   \n"
+    f"                       {_PURPLE}...-++++++:...-=++===-...:=++++==:...-++++==:............{_RESET}                    \n"
+    f"                       {_DARK_PURPLE}...-++++-...:=+++++-...:=+++++=:...-+++++=:.......{_RESET}                           \n"
+    f"                       {_DARK_PURPLE}.....::...:=+++++=:...=+++++=:...-+++++=-.........{_RESET}                           \n"
+    f"                       {_DARK_PURPLE}.........=+++++=:...-++++++-...:++++++=...........{_RESET}                           \n"
+    f"                        {_DARK_PURPLE}......=++++++-...-++++++-...:++++++=.............{_RESET}                           \n"
+    f"                       {_DARK_PURPLE}.....-++++++-...:=+++++=...:=+++++=:........ ....{_RESET}                            \n"
+    f"                       {_DARK_PURPLE}...:++++++=:...=+++++=:...-++++++-........{_RESET}                                   \n"
+    f"                       {_DARK_PURPLE}...-++++=:....:++++=-.....+++++-..........{_RESET}                                   \n"
+    f"                       {_DARK_PURPLE}....:==:.......:==-........-=-............{_RESET}                                   \n"
+    f"                        {_DARK_PURPLE}....... ...... ......  ..  ...... .. ...{_RESET}                                    \n"
+    "                                                                                                    \n"
+    "                                                                                                    \n"
+    "                                                                                                    \n"
+    f"        {_ORANGE}................{_RESET}    {_RED_ORANGE}................{_RESET}    {_RED}.............................. .........{_RESET}            \n"
+    f"        {_ORANGE}................{_RESET}    {_RED_ORANGE}................{_RESET}    {_RED}........................................{_RESET}            \n"
+    f"        {_ORANGE}...:==-. ...-=-.{_RESET}    {_RED_ORANGE}.-=-.....:==-...{_RESET}    {_RED}..-=-.--..-::=:..:==:...:-....--..-:.-=:{_RESET}            \n"
+    f"        {_ORANGE}..%%--+@-.*@+-=@%..#@=-+@*.:@#--#%:.....+@#-=#@%.-@%+=:=@#==#%-.=@-. .%%.-@%*-=%%:..{_RESET}        \n"
+    f"        {_RED_ORANGE}..%%+=:....:-==%@:..:-=+@@.:@%+-:......:@#....@%.-@+...@#....%@.=@-. .%%.-@*...:@#..{_RESET}        \n"
+    f"        {_RED}...-+*#@=.#%+=-#@::@%+=-%@...-+*%@-....:@#....@%.-@=...@#....#@.+@-...@%.-@+....@#..{_RESET}        \n"
+    f"        {_MAGENTA}.-%+::-@*:@*::-@@:=@+::=@@.=@=::+@=.+*..+@*--#@%.-@=...+@=::+@+.-@%::*@%.-@@-::#@-..{_RESET}        \n"
+    f"        {_PURPLE}...+##+:...+##--+..:*#*:=+...+##+...=+....-=-.%%.:*-    .+##+.....+*+.++ -@=-##+. ..{_RESET}        \n"
+    f"        {_PURPLE}........................................+%*--*@=....    .................-@=........{_RESET}        \n"
+    f"        {_DARK_PURPLE}.........................................:-==-:.....    ..................-:........{_RESET}        \n"
+    "                                                ........                                            \n"
+    "                                                ........                                            \n"
+    "                                                                                                    \n"
+    f"                                              {_BLACK}saas.group BYOD Security Checker{_RESET}                     \n"
+    "                                                                                                    \n"
+)
+
+
+# Status symbols used in console messages, written as escapes so the console
+# strings stay ASCII in the source (the embedded sign-in HTML is separate)
+_EMOJI_OK = "\u2705"
+_EMOJI_FAIL = "\u274c"
+_EMOJI_WARN = "\u26a0\ufe0f"
+_EMOJI_SEND = "\U0001F4E1"
+_EMOJI_LOCKED = "\U0001F510"
+_EMOJI_UNLOCKED = "\U0001F513"
+_EMOJI_GLOBE = "\U0001F310"
+_EMOJI_WAIT = "\u23f3"
+_EMOJI_TIMER = "\u23f1\ufe0f"
+_MARK_PASS = "\u2713"
+_MARK_FAIL = "\u2717"
+
+
+# ANSI color codes and status labels for the compliance report
+_GREEN = "\033[92m"
+_LIGHT_RED = "\033[91m"
+_YELLOW = "\033[93m"
+_PASS_LABEL = f"{_GREEN}{_MARK_PASS + ' PASS':8}{_RESET}"
+_FAIL_LABEL = f"{_LIGHT_RED}{_MARK_FAIL + ' FAIL':8}{_RESET}"
+
+
+# Extra `--help` text describing the checks and the n8n integration
+_HELP_EPILOG = """\
+Security Checks:
+  - OS firewall (built-in firewall enabled)
+  - Disk encryption (FileVault/BitLocker/LUKS)
+  - Auto-lock timeout (10 minutes or less)
+  - Guest accounts (disabled)
+
+API Integration:
+  Results are automatically sent to n8n (saas.group default webhook)
+  Default: No authentication required (webhook configured with 'Authorization: None')
+  Use --no-n8n to disable sending to n8n
+  Override webhook: --n8n-webhook 'https://your-n8n-instance.com/webhook/id'
+  Add auth if needed: --n8n-username 'user' --n8n-password 'pass'
+  Or set environment variables: N8N_WEBHOOK_URL, N8N_USERNAME, N8N_PASSWORD"""
+
+
+# Linux DMI files under /sys/devices/virtual/dmi/id/ read into the device info
+_DMI_FIELDS = (
+    ('brand', 'sys_vendor'),
+    ('model', 'product_name'),
+    ('serial', 'product_serial'),
+)
+
+
+# Retry policy for transient n8n webhook errors (server errors, dropped
+# connections, timeouts)
+_WEBHOOK_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+_WEBHOOK_RETRIES = 3
+_WEBHOOK_BACKOFF = 0.5  # seconds, doubled on every retry
+_WEBHOOK_MAX_RETRY_AFTER = 30  # seconds; cap on a server-requested delay
+_WEBHOOK_DEADLINE = 60  # seconds; no new attempt is started after this
+
+# Webhook socket timeouts: fail fast on an unreachable host (TCP connect and TLS
+# handshake; the DNS lookup itself is not bounded by socket timeouts), but give
+# n8n time to answer
+_WEBHOOK_CONNECT_TIMEOUT = 3.05  # seconds
+_WEBHOOK_READ_TIMEOUT = 30  # seconds
+
+# json.dumps separators for the webhook body (no padding after , and :)
+_COMPACT = (',', ':')
+
+
+# Security check result keys and the field prefix each uses in the webhook body
+_CHECK_KEYS = (
+    ('os_firewall', 'firewall'),
+    ('disk_encryption', 'encryption'),
+    ('autolock', 'autolock'),
+    ('guest_accounts', 'guest_accounts'),
+)
+
+
+# Fingerprint of the last successfully sent webhook body, used to skip
+# re-sending unchanged results; volatile fields are left out of the hash
+_LAST_HASH_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                               'byod-tool', 'last_hash')
+_FINGERPRINT_EXCLUDE = frozenset({'timestamp', 'run_id'})
+
+
+@functools.lru_cache(maxsize=1)
+def _system_name() -> str:
+    """Return the lowercased platform.system() name, looked up once per process."""
+    return platform.system().lower()
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_email(email_lower: str) -> bool:
+    """Check a lowercased email's domain against the known domains (memoized)."""
+    return email_lower.rpartition('@')[2] in _VALID_DOMAINS
+
+
+def _payload_fingerprint(url: str, flat_params: Dict[str, any]) -> str:
+    """Hash the webhook URL and body, ignoring fields that change on every run."""
+    # Only needed when sending to the webhook, so import on first use
+    import hashlib
+    
+    stable = {key: value for key, value in flat_params.items() if key not in _FINGERPRINT_EXCLUDE}
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16)
+    digest.update(json.dumps(stable, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _read_last_hash() -> Optional[str]:
+    """Return the fingerprint of the last successful send, if recorded."""
+    try:
+        with open(_LAST_HASH_FILE, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_last_hash(fingerprint: str):
+    """Record the fingerprint of a successful send (atomically, best effort)."""
+    # Only needed after a successful webhook send, so import on first use
+    import tempfile
+    
+    cache_dir = os.path.dirname(_LAST_HASH_FILE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=cache_dir, delete=False) as f:
+            f.write(fingerprint)
+        os.replace(f.name, _LAST_HASH_FILE)
+    except OSError:
+        pass
+
+
+def _write_lines(lines: List[str]):
+    """Write buffered status lines to stdout with a single write."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+
+
+def _retry_after_seconds(value: Optional[str], default: float) -> float:
+    """Parse a Retry-After header (seconds or HTTP date), else return default."""
+    if not value:
+        return default
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return default
+        delay = (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), _WEBHOOK_MAX_RETRY_AFTER)
+
+
+class AuthHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded sign-in server that never shares a port with another listener"""
+    
+    # No SO_REUSEADDR: on Windows it lets bind() succeed on a port another
+    # process is listening on, and on macOS/BSD it lets our wildcard bind
+    # coexist with another process's 127.0.0.1 listener, which then gets the
+    # browser's localhost requests. The port scan skips busy ports instead.
+    allow_reuse_address = False
+
+
+class AuthHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
     """Custom HTTP handler for Google Sign-In authentication"""
     
-    def __init__(self, *args, auth_result=None, **kwargs):
-        self.auth_result = auth_result
-        super().__init__(*args, **kwargs)
+    # Shared auth result dict and the sign-in page, bound per server by
+    # subclassing (see SecurityChecker._authenticate_with_google)
+    auth_result = None
+    html_bytes = b''
+    
+    # Pre-encoded reply for a successful /auth-complete POST
+    _OK_BODY = b'{"status": "success"}'
+    _OK_LENGTH = str(len(_OK_BODY))
     
     def do_POST(self):
         if self.path == '/auth-complete':
@@ -83,14 +410,15 @@ class AuthHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                 # Store the authenticated email
                 if 'email' in data and self.auth_result is not None:
                     self.auth_result['email'] = data['email']
-                    self.auth_result['complete'] = True
+                    self.auth_result['event'].set()
                 
                 # Send response with error handling for broken pipe
                 try:
                     self.send_response(200)
                     self.send_header('Content-type', 'application/json')
+                    self.send_header('Content-Length', self._OK_LENGTH)
                     self.end_headers()
-                    self.wfile.write(json.dumps({'status': 'success'}).encode())
+                    self.wfile.write(self._OK_BODY)
                 except (BrokenPipeError, ConnectionResetError):
                     # Browser closed connection - this is expected behavior
                     pass
@@ -116,8 +444,21 @@ class AuthHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                 pass
     
     def do_GET(self):
-        # Use parent class to serve static files
-        return super().do_GET()
+        # Serve the sign-in page from memory; nothing else is exposed
+        path = self.path.split('?', 1)[0]
+        try:
+            if path == '/' or path.endswith('.html'):
+                self.send_response(200)
+                self.send_header('Content-type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(self.html_bytes)))
+                self.end_headers()
+                self.wfile.write(self.html_bytes)
+            else:
+                self.send_response(404)
+                self.end_headers()
+        except (BrokenPipeError, ConnectionResetError):
+            # Browser closed connection - this is expected behavior
+            pass
     
     def log_message(self, format, *args):
         # Suppress server logs
@@ -125,6 +466,15 @@ class AuthHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
 
 
 class SecurityChecker:
+    # Fixed attribute set: no per-instance __dict__, slot-based attribute access
+    __slots__ = (
+        'system', '_cmd_timeout', '_plat_system', '_plat_release', '_plat_machine',
+        '_device_info', '_http_conn', '_http_conn_key', '_http_proxy_headers', '_headers',
+        '_linux_firewall_tools',
+        'n8n_webhook_url', 'api_key', 'n8n_username', 'n8n_password',
+        'results', 'valid_domains', '_dispatch', '_run_id',
+    )
+    
     @staticmethod
     def _map_platform_name(platform_name: str) -> str:
         """Map platform.system() names to user-friendly names."""
@@ -134,8 +484,24 @@ class SecurityChecker:
             'Linux': 'Linux'
         }
         return platform_map.get(platform_name, platform_name)
-    def __init__(self, n8n_webhook_url=None, api_key=None, n8n_username=None, n8n_password=None):
-        self.system = platform.system().lower()
+    def __init__(self, n8n_webhook_url=None, api_key=None, n8n_username=None, n8n_password=None,
+                 cmd_timeout=15):
+        self.system = _system_name()
+        # Default per-command timeout (seconds) so a hung tool can't stall a check
+        self._cmd_timeout = cmd_timeout
+        # Platform details used in the report, looked up once
+        self._plat_system = platform.system()
+        self._plat_release = platform.release()
+        self._plat_machine = platform.machine()
+        self._device_info = None
+        self._http_conn = None
+        self._http_conn_key = None
+        # Extra headers for a forwarding proxy; None for direct or tunnelled connections
+        self._http_proxy_headers = None
+        self._headers = None
+        # Identifies this run's webhook requests so n8n can drop retried duplicates
+        self._run_id = uuid.uuid4().hex
+        self._linux_firewall_tools = None
         # Use provided values or fall back to environment variables, then defaults
         self.n8n_webhook_url = (n8n_webhook_url or 
                                os.getenv('N8N_WEBHOOK_URL') or 
@@ -152,131 +518,18 @@ class SecurityChecker:
             'guest_accounts': {'status': False, 'message': '', 'remediation': ''}
         }
         # Known saas.group domains (main company + portfolio companies)
-        self.valid_domains = {
-            'addsearch.co',
-            'addsearch.com',
-            'advancedshippingmanager.com',
-            'beekast.com',
-            'crosstalent-rh.fr',
-            'crosstalent.at',
-            'crosstalent.be',
-            'crosstalent.co.uk',
-            'crosstalent.com',
-            'crosstalent.de',
-            'crosstalent.eu',
-            'crosstalent.fr',
-            'crosstalent.it',
-            'crosstalent.nl',
-            'dashthis.com',
-            'getprerender.com',
-            'getrewardful.com',
-            'getscraperapi.com',
-            'getusersnap.com',
-            'gfconsulting.info',
-            'git-tower.com',
-            'gominga.com',
-            'infonline.de',
-            'juicer.io',
-            'keyword-rank-tracking.com',
-            'keyword.com',
-            'keyword.net',
-            'keyword.org',
-            'kingwebmaster.com',
-            'myworks.software',
-            'picdrop.com',
-            'picdrop.de',
-            'pipelinecrm.com',
-            'pipelinedeals.com',
-            'pipelinedealsco.com',
-            'pipelinesales.com',
-            'prerender.io',
-            'rewardful.com',
-            'rewardful.io',
-            'saas.blackfriday',
-            'saas.group',
-            'schumacher.me',
-            'scraperapi.cloud',
-            'scraperapi.co',
-            'scraperapi.com',
-            'scraperapi.io',
-            'seobility.net',
-            'timebutler.com',
-            'timebutler.de',
-            'tryprerender.com',
-            'tryrewardful.co',
-            'tryrewardful.com',
-            'tsventures.io',
-            'userewardful.com',
-            'usersnap.com',
-            'zenloop.com'
+        self.valid_domains = _VALID_DOMAINS
+        # Platform-specific check implementations, resolved once
+        suffix = _PLAT_SUFFIX.get(self.system)
+        self._dispatch = {
+            name: getattr(self, f'_check_{suffix}_{name}') if suffix else self._unsupported_platform
+            for name in ('firewall', 'encryption', 'autolock', 'guest_accounts')
         }
     
     def display_header(self):
         """Display the saas.group branded header with gradient colors."""
-        # ANSI color codes for gradient effect (orange to purple)
-        orange = "\033[38;5;208m"  # Orange
-        red_orange = "\033[38;5;202m"  # Red-orange
-        red = "\033[38;5;196m"  # Red
-        magenta = "\033[38;5;198m"  # Magenta
-        purple = "\033[38;5;135m"  # Purple
-        dark_purple = "\033[38;5;93m"  # Dark purple
-        reset = "\033[0m"  # Reset color
-        black = "\033[30m"  # Black for text
-        
-        print("                                                                                                    ")
-        print("                                                                                                    ")
-        print("                                                                                                    ")
-        print("                                                                                                    ")
-        print(f"                                       {orange}... .........................  ...{reset}                           ")
-        print(f"                                       {orange}... .. ...........................{reset}                           ")
-        print(f"                                        {orange}...... .........::::.............{reset}                           ")
-        print(f"                                        {orange}... ......:-=============-:......{reset}                           ")
-        print(f"                                  {orange}... .........:====================-:...  .{reset}                        ")
-        print(f"                                {red_orange}.............-========--:::::--=======-:.......{reset}                     ")
-        print(f"                               {red_orange}............:=======:.............:======-.......{reset}                    ")
-        print(f"                               {red_orange}..........:=======:....:--===--:....:======.......{reset}                   ")
-        print(f"                        {red_orange}. ... ..........=======:...:=============:...-=====......{reset}                   ")
-        print(f"                       {red}...............-+=====:...:=================...-====-.....{reset}                   ")
-        print(f"                       {red}.............-=+++++-...:======-:.....:-=====...-====:....{reset}                   ")
-        print(f"                       {red}...........-=+++++-....-======:...:::...-====-..:====-....{reset}                   ")
-        print(f"                       {red}.........:=+++++=:...-======:...:====-...=====...=====...{reset}                    ")
-        print(f"                       {red}.......:=+++++=:...:======-...:======-...=====...=====....{reset}                   ")
-        print(f"                       {magenta}......=++++++-...:======-....======-....=====-..:====-....{reset}                   ")
-        print(f"                       {magenta}....-++++++-...:=======....-======:...-======...=====:....{reset}                   ")
-        print(f"                       {magenta}...-+++++=...:=++++==:...-======:...:======-...-====-.....{reset}                   ")
-        print(f"                       {magenta}...:+++=:...-+++++=:...:======-...:======-:...======.....{reset}                    ")
-        print(f"                        {magenta}.........-+++++=-...:======-...:=======:...-=====-.....{reset}                     ")
-        print(f"                       {purple}........:++++++=....=======:...-======-...:======-........{reset}                   ")
-        print(f"                       {purple}......:++++++=....=======:...-======-...:=======..........{reset}                   ")
-        print(f"                       {purple}....:=+++++=:...-======-...:======-...:=======:...........{reset}                   ")
-        print(f"                       {purple}...-++++++:...-=++===-...:=++++==:...-++++==:............{reset}                    ")
-        print(f"                       {dark_purple}...-++++-...:=+++++-...:=+++++=:...-+++++=:.......{reset}                           ")
-        print(f"                       {dark_purple}.....::...:=+++++=:...=+++++=:...-+++++=-.........{reset}                           ")
-        print(f"                       {dark_purple}.........=+++++=:...-++++++-...:++++++=...........{reset}                           ")
-        print(f"                        {dark_purple}......=++++++-...-++++++-...:++++++=.............{reset}                           ")
-        print(f"                       {dark_purple}.....-++++++-...:=+++++=...:=+++++=:........ ....{reset}                            ")
-        print(f"                       {dark_purple}...:++++++=:...=+++++=:...-++++++-........{reset}                                   ")
-        print(f"                       {dark_purple}...-++++=:....:++++=-.....+++++-..........{reset}                                   ")
-        print(f"                       {dark_purple}....:==:.......:==-........-=-............{reset}                                   ")
-        print(f"                        {dark_purple}....... ...... ......  ..  ...... .. ...{reset}                                    ")
-        print("                                                                                                    ")
-        print("                                                                                                    ")
-        print("                                                                                                    ")
-        print(f"        {orange}................{reset}    {red_orange}................{reset}    {red}.............................. .........{reset}            ")
-        print(f"        {orange}................{reset}    {red_orange}................{reset}    {red}........................................{reset}            ")
-        print(f"        {orange}...:==-. ...-=-.{reset}    {red_orange}.-=-.....:==-...{reset}    {red}..-=-.--..-::=:..:==:...:-....--..-:.-=:{reset}            ")
-        print(f"        {orange}..%%--+@-.*@+-=@%..#@=-+@*.:@#--#%:.....+@#-=#@%.-@%+=:=@#==#%-.=@-. .%%.-@%*-=%%:..{reset}        ")
-        print(f"        {red_orange}..%%+=:....:-==%@:..:-=+@@.:@%+-:......:@#....@%.-@+...@#....%@.=@-. .%%.-@*...:@#..{reset}        ")
-        print(f"        {red}...-+*#@=.#%+=-#@::@%+=-%@...-+*%@-....:@#....@%.-@=...@#....#@.+@-...@%.-@+....@#..{reset}        ")
-        print(f"        {magenta}.-%+::-@*:@*::-@@:=@+::=@@.=@=::+@=.+*..+@*--#@%.-@=...+@=::+@+.-@%::*@%.-@@-::#@-..{reset}        ")
-        print(f"        {purple}...+##+:...+##--+..:*#*:=+...+##+...=+....-=-.%%.:*-    .+##+.....+*+.++ -@=-##+. ..{reset}        ")
-        print(f"        {purple}........................................+%*--*@=....    .................-@=........{reset}        ")
-        print(f"        {dark_purple}.........................................:-==-:.....    ..................-:........{reset}        ")
-        print("                                                ........                                            ")
-        print("                                                ........                                            ")
-        print("                                                                                                    ")
-        print(f"                                              {black}saas.group BYOD Security Checker{reset}                     ")
-        print("                                                                                                    ")
+        sys.stdout.write(_BANNER)
+        sys.stdout.flush()
     
     def validate_email(self, email: str) -> bool:
         """Validate if email belongs to saas.group or its portfolio companies."""
@@ -284,14 +537,13 @@ class SecurityChecker:
             return False
         
         try:
-            domain = email.split('@')[1].lower()
-            return domain in self.valid_domains
-        except (IndexError, AttributeError):
+            return _is_valid_email(email.lower())
+        except AttributeError:
             return False
     
     def get_user_email(self) -> str:
         """Authenticate user via Google Sign-In and validate domain."""
-        print("\n🔐 Authentication Required")
+        print(f"\n{_EMOJI_LOCKED} Authentication Required")
         print("This tool requires authentication with your saas.group Google account.")
         print("A web browser will open for secure authentication.")
         
@@ -300,90 +552,100 @@ class SecurityChecker:
     
     def _authenticate_with_google(self) -> str:
         """Authenticate user with Google Sign-In."""
+        # Only needed for the sign-in flow, so import on first use
+        import site
+        import webbrowser
+        
+        server = None
         try:
-            # Check if we have a local HTML file, otherwise create a temporary one
-            html_file = os.path.join(os.path.dirname(__file__), 'google_signin.html')
-            temp_html = None
+            # The sign-in page sits next to this script in a checkout; a pip
+            # install puts it under <prefix>/share/byod-tool instead. The
+            # built-in page is only a placeholder without the Google button.
+            html_candidates = [
+                os.path.join(os.path.dirname(__file__), 'google_signin.html'),
+                os.path.join(sys.prefix, 'share', 'byod-tool', 'google_signin.html'),
+                os.path.join(site.getuserbase(), 'share', 'byod-tool', 'google_signin.html'),
+            ]
+            html_file = next((path for path in html_candidates if os.path.exists(path)), None)
             
-            if not os.path.exists(html_file):
-                # Create temporary HTML file
-                temp_html = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False)
-                temp_html.write(self._get_signin_html())
-                temp_html.close()
-                html_file = temp_html.name
+            if html_file:
+                with open(html_file, 'rb') as f:
+                    html_bytes = f.read()
+            else:
+                html_bytes = self._get_signin_html().encode('utf-8')
             
-            # Start a simple HTTP server to serve the HTML file
+            # Start a simple HTTP server to serve the page from memory
             # Create shared auth result dictionary
-            auth_result = {'email': None, 'complete': False}
+            auth_result = {'email': None, 'event': threading.Event()}
             
-            # Create handler factory with auth_result
-            def create_handler(*args, **kwargs):
-                return AuthHTTPRequestHandler(*args, auth_result=auth_result, **kwargs)
+            # Bind auth_result and the page once on a handler subclass for this server
+            handler_cls = type('BoundAuthHTTPRequestHandler', (AuthHTTPRequestHandler,),
+                               {'auth_result': auth_result, 'html_bytes': html_bytes})
             
-            # Find available port
+            # Find available port. The port can't be left to the kernel: the
+            # Google client only accepts the localhost origins registered for it.
+            # SO_REUSEADDR is off, so a port that is in use (or still in
+            # TIME_WAIT from a previous run) fails to bind and the next one
+            # is tried.
+            # Requests are handled on their own threads, so the /auth-complete
+            # POST is never queued behind a page or asset download.
             port = 8080
             max_port_attempts = 10
-            server = None
             
             for _ in range(max_port_attempts):
                 try:
-                    server = socketserver.TCPServer(("", port), create_handler)
+                    server = AuthHTTPServer(("", port), handler_cls)
                     break
                 except OSError:
                     port += 1
             
             if server is None:
-                print("❌ Could not start local server. Google Sign-In is required.")
+                print(f"{_EMOJI_FAIL} Could not start local server. Google Sign-In is required.")
                 sys.exit(1)
             
-            # Change to the directory containing the HTML file
-            original_dir = os.getcwd()
-            os.chdir(os.path.dirname(html_file))
-            
             # Start server in background thread
             server_thread = threading.Thread(target=server.serve_forever)
             server_thread.daemon = True
             server_thread.start()
             
-            print(f"🌐 Starting authentication server on port {port}...")
+            print(f"{_EMOJI_GLOBE} Starting authentication server on port {port}...")
             
             # Open browser
-            auth_url = f"http://localhost:{port}/{os.path.basename(html_file)}"
+            auth_url = f"http://localhost:{port}/google_signin.html"
             print(f"Opening browser: {auth_url}")
             webbrowser.open(auth_url)
             
             # Wait for authentication
-            print("⏳ Waiting for authentication...")
+            print(f"{_EMOJI_WAIT} Waiting for authentication...")
             print("Please complete the Google Sign-In process in your browser.")
             print("Press Ctrl+C to cancel or use fallback method.")
             
             max_wait_time = 300  # 5 minutes
-            start_time = time.time()
+            deadline = time.monotonic() + max_wait_time
             
-            while time.time() - start_time < max_wait_time:
-                try:
-                    # Check if authentication is complete
-                    if auth_result['complete'] and auth_result['email']:
-                        server.shutdown()
-                        email = auth_result['email']
-                        print(f"✓ Google authentication successful: {email}")
-                        return email
-                    
-                    time.sleep(1)  # Check every second
-                    
-                except KeyboardInterrupt:
-                    print("\n\nAuthentication cancelled.")
-                    break
-                except Exception as e:
-                    print(f"Error during authentication: {e}")
-                    break
+            try:
+                # Wait in short slices until the handler signals completion (or
+                # we time out); a single long wait can't be interrupted by
+                # Ctrl+C on Windows
+                while not auth_result['event'].wait(0.5):
+                    if time.monotonic() >= deadline:
+                        break
+                
+                if auth_result['event'].is_set() and auth_result['email']:
+                    server.shutdown()
+                    email = auth_result['email']
+                    print(f"{_MARK_PASS} Google authentication successful: {email}")
+                    return email
+                
+                print(f"{_EMOJI_TIMER} Authentication timed out. Google Sign-In is required.")
+            except KeyboardInterrupt:
+                print("\n\nAuthentication cancelled.")
             
-            print("⏱️ Authentication timed out. Google Sign-In is required.")
             server.shutdown()
             sys.exit(1)
             
         except Exception as e:
-            print(f"❌ Google Sign-In failed: {e}")
+            print(f"{_EMOJI_FAIL} Google Sign-In failed: {e}")
             print("Google Sign-In is required to use this tool.")
             if server:
                 server.shutdown()
@@ -392,15 +654,6 @@ class SecurityChecker:
             # Cleanup
             if server:
                 server.shutdown()
-            if temp_html:
-                try:
-                    os.unlink(temp_html)
-                except:
-                    pass
-            try:
-                os.chdir(original_dir)
-            except:
-                pass
     
     def _get_signin_html(self) -> str:
         """Get the HTML content for Google Sign-In."""
@@ -545,7 +798,16 @@ class SecurityChecker:
 </html>'''
     
     def get_device_info(self) -> Dict[str, str]:
-        """Get device information (brand, model, serial, RAM, storage)."""
+        """Get device information (brand, model, serial, RAM, storage).
+
+        The probes are only run once per checker; later calls reuse the result.
+        """
+        if self._device_info is None:
+            self._device_info = self._collect_device_info()
+        return dict(self._device_info)
+    
+    def _collect_device_info(self) -> Dict[str, str]:
+        """Run the platform-specific probes for get_device_info."""
         info = {
             'brand': 'Unknown',
             'model': 'Unknown', 
@@ -560,21 +822,27 @@ class SecurityChecker:
                 # Get brand (always Apple for macOS)
                 info['brand'] = 'Apple'
                 
+                # The probes are independent, so run them side by side
+                outputs = self._run_commands({
+                    'model': ['sysctl', '-n', 'hw.model'],
+                    'serial': "ioreg -c IOPlatformExpertDevice -d 2 | awk -F'\"' '/IOPlatformSerialNumber/ {print $4}'",
+                    'ram': ['sysctl', '-n', 'hw.memsize'],
+                    'storage': ['df', '-h', '/'],
+                }, timeout=5)
+                
                 # Get model - try alternative methods first
                 # Try sysctl (should work without Xcode tools)
-                success, output = self.run_command('sysctl -n hw.model')
+                success, output = outputs['model']
                 if success and output.strip():
                     info['model'] = output.strip()
                 
                 # Get serial number - try ioreg first (should work without Xcode tools)
-                success, output = self.run_command('ioreg -c IOPlatformExpertDevice -d 2 | grep IOPlatformSerialNumber')
-                if success:
-                    serial_match = re.search(r'"IOPlatformSerialNumber" = "(.+?)"', output)
-                    if serial_match:
-                        info['serial'] = serial_match.group(1).strip()
+                success, output = outputs['serial']
+                if success and output.strip():
+                    info['serial'] = output.strip()
                 
                 # Get RAM using sysctl (should work without Xcode tools)
-                success, output = self.run_command('sysctl -n hw.memsize')
+                success, output = outputs['ram']
                 if success and output.strip():
                     try:
                         ram_bytes = int(output.strip())
@@ -583,30 +851,22 @@ class SecurityChecker:
                     except ValueError:
                         pass
                 
-                # Fallback: try system_profiler only if the above methods failed
+                # Fallback: system_profiler enumerates the whole hardware tree and
+                # takes seconds, so only use it if the targeted probes above failed
                 if info['model'] == 'Unknown' or info['serial'] == 'Unknown' or info['ram'] == 'Unknown':
                     # Check if system_profiler exists and won't trigger Xcode install
-                    success, output = self.run_command('which system_profiler')
-                    if success and output.strip():
-                        success, output = self.run_command('system_profiler SPHardwareDataType')
+                    if shutil.which('system_profiler'):
+                        success, output = self.run_command(['system_profiler', 'SPHardwareDataType'])
                         if success:
-                            if info['model'] == 'Unknown':
-                                model_match = re.search(r'Model Name: (.+)', output)
-                                if model_match:
-                                    info['model'] = model_match.group(1).strip()
-                            
-                            if info['serial'] == 'Unknown':
-                                serial_match = re.search(r'Serial Number \(system\): (.+)', output)
-                                if serial_match:
-                                    info['serial'] = serial_match.group(1).strip()
-                            
-                            if info['ram'] == 'Unknown':
-                                ram_match = re.search(r'Memory: (.+)', output)
-                                if ram_match:
-                                    info['ram'] = ram_match.group(1).strip()
+                            # Fill in only the fields still unknown, keeping the
+                            # first match for each like re.search would
+                            for match in _HARDWARE_RE.finditer(output):
+                                key = match.lastgroup
+                                if info[key] == 'Unknown':
+                                    info[key] = match.group(key).strip()
                 
                 # Get storage info
-                success, output = self.run_command('df -h /')
+                success, output = outputs['storage']
                 if success:
                     lines = output.strip().split('\n')
                     if len(lines) > 1:
@@ -616,63 +876,60 @@ class SecurityChecker:
                             
             elif self.system == 'windows':
                 # Windows device info
-                # Get brand and model
-                success, output = self.run_command('wmic computersystem get manufacturer,model')
+                # A single PowerShell process queries all CIM classes at once
+                # (wmic is deprecated and starts a new COM client per call)
+                success, output = self.run_command([
+                    'powershell', '-NoProfile', '-Command',
+                    '@{'
+                    'cs=Get-CimInstance Win32_ComputerSystem | Select-Object Manufacturer,Model,TotalPhysicalMemory; '
+                    'bios=Get-CimInstance Win32_BIOS | Select-Object SerialNumber; '
+                    "disk=Get-CimInstance -Query 'SELECT Size FROM Win32_LogicalDisk WHERE DeviceID=''C:''' | Select-Object Size"
+                    '} | ConvertTo-Json -Depth 3'
+                ], timeout=10)
                 if success:
-                    lines = output.strip().split('\n')
-                    if len(lines) > 1:
-                        parts = lines[1].split()
-                        if len(parts) >= 2:
-                            info['brand'] = parts[0]
-                            info['model'] = ' '.join(parts[1:])
-                
-                # Get serial number
-                success, output = self.run_command('wmic bios get serialnumber')
-                if success:
-                    lines = output.strip().split('\n')
-                    if len(lines) > 1:
-                        info['serial'] = lines[1].strip()
-                
-                # Get RAM
-                success, output = self.run_command('wmic computersystem get TotalPhysicalMemory')
-                if success:
-                    lines = output.strip().split('\n')
-                    if len(lines) > 1:
-                        ram_bytes = int(lines[1].strip())
-                        ram_gb = ram_bytes / (1024**3)
+                    data = json.loads(output)
+                    cs = data.get('cs') or {}
+                    bios = data.get('bios') or {}
+                    disk = data.get('disk') or {}
+                    
+                    # Get brand and model
+                    if cs.get('Manufacturer'):
+                        info['brand'] = cs['Manufacturer'].strip()
+                    if cs.get('Model'):
+                        info['model'] = cs['Model'].strip()
+                    
+                    # Get serial number
+                    if bios.get('SerialNumber'):
+                        info['serial'] = bios['SerialNumber'].strip()
+                    
+                    # Get RAM
+                    if cs.get('TotalPhysicalMemory'):
+                        ram_gb = int(cs['TotalPhysicalMemory']) / (1024**3)
                         info['ram'] = f"{ram_gb:.1f} GB"
-                
-                # Get storage
-                success, output = self.run_command('wmic logicaldisk get size,freespace,caption')
-                if success:
-                    lines = output.strip().split('\n')
-                    total_size = 0
-                    for line in lines[1:]:
-                        parts = line.split()
-                        if len(parts) >= 3 and parts[0] == 'C:':
-                            size_bytes = int(parts[2])
-                            size_gb = size_bytes / (1024**3)
-                            info['storage'] = f"{size_gb:.1f} GB"
-                            break
+                    
+                    # Get storage
+                    if disk.get('Size'):
+                        size_gb = int(disk['Size']) / (1024**3)
+                        info['storage'] = f"{size_gb:.1f} GB"
                             
             elif self.system == 'linux':
                 # Linux device info
-                # Get brand and model
-                if os.path.exists('/sys/devices/virtual/dmi/id/sys_vendor'):
-                    with open('/sys/devices/virtual/dmi/id/sys_vendor', 'r') as f:
-                        info['brand'] = f.read().strip()
-                
-                if os.path.exists('/sys/devices/virtual/dmi/id/product_name'):
-                    with open('/sys/devices/virtual/dmi/id/product_name', 'r') as f:
-                        info['model'] = f.read().strip()
+                outputs = self._run_commands({
+                    'ram': ['free', '-h'],
+                    'storage': ['df', '-h', '/'],
+                }, timeout=5)
                 
-                # Get serial number
-                if os.path.exists('/sys/devices/virtual/dmi/id/product_serial'):
-                    with open('/sys/devices/virtual/dmi/id/product_serial', 'r') as f:
-                        info['serial'] = f.read().strip()
+                # Get brand, model and serial number from DMI. Missing files are
+                # skipped, as is product_serial when it is only readable by root.
+                for key, name in _DMI_FIELDS:
+                    try:
+                        with open(f'/sys/devices/virtual/dmi/id/{name}', 'r') as f:
+                            info[key] = f.read().strip()
+                    except OSError:
+                        pass
                 
                 # Get RAM
-                success, output = self.run_command('free -h')
+                success, output = outputs['ram']
                 if success:
                     lines = output.strip().split('\n')
                     if len(lines) > 1:
@@ -681,7 +938,7 @@ class SecurityChecker:
                             info['ram'] = parts[1]
                 
                 # Get storage
-                success, output = self.run_command('df -h /')
+                success, output = outputs['storage']
                 if success:
                     lines = output.strip().split('\n')
                     if len(lines) > 1:
@@ -705,8 +962,20 @@ class SecurityChecker:
         print(f"  Storage:      {info['storage']}")
         print()
     
-    def run_command(self, command: str, shell: bool = True) -> Tuple[bool, str]:
-        """Execute a system command and return success status and output."""
+    def run_command(self, command: Union[str, List[str]], shell: Optional[bool] = None,
+                    timeout: Optional[int] = None, capture_stderr: bool = False) -> Tuple[bool, str]:
+        """Execute a system command and return success status and output.
+        
+        Strings run through the shell (needed for pipes); argv lists run the
+        program directly, which saves spawning an extra shell process.
+        stderr is discarded unless capture_stderr is set, in which case it is
+        merged into the returned output.
+        """
+        if shell is None:
+            shell = isinstance(command, str)
+        if timeout is None:
+            timeout = self._cmd_timeout
+        stderr = subprocess.STDOUT if capture_stderr else subprocess.DEVNULL
         try:
             # Check if command might trigger Xcode installation on macOS
             if self.system == 'darwin' and any(cmd in command for cmd in ['system_profiler']):
@@ -716,42 +985,64 @@ class SecurityChecker:
                 result = subprocess.run(
                     command,
                     shell=shell,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
                     text=True,
-                    timeout=10,  # Shorter timeout for potentially problematic commands
+                    timeout=min(timeout, 10),  # Shorter timeout for potentially problematic commands
                     env=env
                 )
             else:
                 result = subprocess.run(
                     command,
                     shell=shell,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
                     text=True,
-                    timeout=30
+                    timeout=timeout
                 )
             return result.returncode == 0, result.stdout.strip()
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
+        except subprocess.TimeoutExpired:
+            return False, ''
+        except (subprocess.SubprocessError, OSError) as e:
+            # OSError covers argv commands whose program is not installed
             return False, str(e)
     
+    def _run_commands(self, commands: Dict[str, Union[str, List[str]]],
+                      timeout: Optional[int] = None) -> Dict[str, Tuple[bool, str]]:
+        """Run independent commands concurrently, keyed like the input dict."""
+        with ThreadPoolExecutor(max_workers=max(len(commands), 1)) as executor:
+            futures = {key: executor.submit(self.run_command, command, timeout=timeout)
+                       for key, command in commands.items()}
+            return {key: future.result() for key, future in futures.items()}
+    
+    def _read_plist_value(self, path: str, key: str):
+        """Read a single key from a preferences plist without forking `defaults`."""
+        try:
+            with open(path, 'rb') as f:
+                return plistlib.load(f).get(key)
+        except (OSError, plistlib.InvalidFileException, ValueError, AttributeError):
+            return None
+    
+    def _unsupported_platform(self) -> Dict[str, any]:
+        """Result for checks on a platform without an implementation."""
+        return {'status': False, 'message': f'Unsupported platform: {self.system}', 'remediation': ''}
+    
     def check_os_firewall(self) -> Dict[str, any]:
         """Check if OS firewall is enabled."""
-        if self.system == 'darwin':
-            return self._check_macos_firewall()
-        elif self.system == 'windows':
-            return self._check_windows_firewall()
-        elif self.system == 'linux':
-            return self._check_linux_firewall()
-        else:
-            return {'status': False, 'message': f'Unsupported platform: {self.system}'}
+        return self._dispatch['firewall']()
     
     def _check_macos_firewall(self) -> Dict[str, any]:
         """Check macOS firewall status."""
         try:
-            # Try to check firewall status using defaults (non-privileged)
-            success, output = self.run_command('defaults read /Library/Preferences/com.apple.alf globalstate')
-            if success:
+            # Read the firewall state straight from its (world-readable) plist,
+            # falling back to defaults (non-privileged)
+            state = self._read_plist_value('/Library/Preferences/com.apple.alf.plist', 'globalstate')
+            if state is None:
+                success, output = self.run_command(['defaults', 'read', '/Library/Preferences/com.apple.alf', 'globalstate'])
+                state = output.strip() if success else None
+            if state is not None:
                 try:
-                    state = int(output.strip())
+                    state = int(state)
                     if state == 1:
                         return {'status': True, 'message': 'macOS firewall is enabled', 'remediation': ''}
                     elif state == 2:
@@ -762,7 +1053,7 @@ class SecurityChecker:
                     pass
             
             # Fallback: Try to check if firewall process is running
-            success, output = self.run_command('pgrep -f "socketfilterfw"')
+            success, output = self.run_command(['pgrep', '-f', 'socketfilterfw'])
             if success and output.strip():
                 return {'status': True, 'message': 'macOS firewall appears to be running', 'remediation': ''}
             
@@ -775,35 +1066,46 @@ class SecurityChecker:
     def _check_windows_firewall(self) -> Dict[str, any]:
         """Check Windows firewall status."""
         try:
-            # Check Windows Defender Firewall status
-            success, output = self.run_command('netsh advfirewall show allprofiles state')
-            if success:
-                # Check if all profiles are enabled
-                domain_enabled = 'Domain Profile' in output and 'State' in output and 'ON' in output
-                private_enabled = 'Private Profile' in output and 'State' in output and 'ON' in output
-                public_enabled = 'Public Profile' in output and 'State' in output and 'ON' in output
+            # Check Windows Defender Firewall status with one PowerShell call that
+            # returns structured (and, unlike netsh, locale-independent) output
+            success, output = self.run_command([
+                'powershell', '-NoProfile', '-Command',
+                'Get-NetFirewallProfile | Select-Object Name,Enabled | ConvertTo-Json -Compress'
+            ])
+            profiles = []
+            if success and output:
+                try:
+                    profiles = json.loads(output)
+                except ValueError:
+                    # Not JSON (e.g. a warning on stdout); fall back to netsh below
+                    profiles = []
+                if isinstance(profiles, dict):
+                    profiles = [profiles]
+                elif not isinstance(profiles, list):
+                    profiles = []
+                profiles = [p for p in profiles if isinstance(p, dict)]
+            if profiles:
+                # Enabled is a GpoBoolean: 1 (True), 0 (False) or 2 (NotConfigured)
+                disabled_profiles = [p.get('Name', '?') for p in profiles if p.get('Enabled') not in (1, 'True')]
                 
-                if domain_enabled and private_enabled and public_enabled:
+                if not disabled_profiles:
                     return {'status': True, 'message': 'Windows Defender Firewall is enabled for all profiles', 'remediation': ''}
                 else:
-                    disabled_profiles = []
-                    if not domain_enabled:
-                        disabled_profiles.append('Domain')
-                    if not private_enabled:
-                        disabled_profiles.append('Private')
-                    if not public_enabled:
-                        disabled_profiles.append('Public')
                     disabled_profiles_str = ', '.join(disabled_profiles)
                     return {'status': False, 'message': f'Windows Defender Firewall is disabled for: {disabled_profiles_str}', 'remediation': 'Enable Windows Defender Firewall: Control Panel > System and Security > Windows Defender Firewall > Turn Windows Defender Firewall on or off'}
             
-            # Alternative check using PowerShell
-            success, output = self.run_command('powershell -Command "Get-NetFirewallProfile | Select-Object Name, Enabled"')
+            # Fallback: netsh, for systems where the NetSecurity module is unavailable
+            success, output = self.run_command(['netsh', 'advfirewall', 'show', 'allprofiles', 'state'])
             if success:
-                enabled_count = output.count('True')
-                if enabled_count >= 3:
-                    return {'status': True, 'message': 'Windows Defender Firewall is enabled', 'remediation': ''}
+                # Check if all profiles are enabled, reading each profile's own State line
+                states = {profile.capitalize(): state.upper() for profile, state in _NETSH_PROFILE_RE.findall(output)}
+                disabled_profiles = [p for p in ('Domain', 'Private', 'Public') if states.get(p) != 'ON']
+                
+                if not disabled_profiles:
+                    return {'status': True, 'message': 'Windows Defender Firewall is enabled for all profiles', 'remediation': ''}
                 else:
-                    return {'status': False, 'message': 'Windows Defender Firewall is not fully enabled', 'remediation': 'Enable Windows Defender Firewall: Control Panel > System and Security > Windows Defender Firewall > Turn Windows Defender Firewall on or off'}
+                    disabled_profiles_str = ', '.join(disabled_profiles)
+                    return {'status': False, 'message': f'Windows Defender Firewall is disabled for: {disabled_profiles_str}', 'remediation': 'Enable Windows Defender Firewall: Control Panel > System and Security > Windows Defender Firewall > Turn Windows Defender Firewall on or off'}
             
             return {'status': False, 'message': 'Unable to check firewall status', 'remediation': 'Enable Windows Defender Firewall: Control Panel > System and Security > Windows Defender Firewall > Turn Windows Defender Firewall on or off'}
                 
@@ -813,31 +1115,31 @@ class SecurityChecker:
     def _check_linux_firewall(self) -> Dict[str, any]:
         """Check Linux firewall status."""
         try:
+            # Only run the firewall tools that are actually installed
+            if self._linux_firewall_tools is None:
+                self._linux_firewall_tools = {name: shutil.which(name) for name in ('ufw', 'iptables', 'firewall-cmd')}
+            tools = self._linux_firewall_tools
+            
             # Check UFW (Uncomplicated Firewall)
-            success, output = self.run_command('ufw status')
-            if success:
-                if 'Status: active' in output:
+            success, output = self.run_command(['ufw', 'status']) if tools['ufw'] else (False, '')
+            status_match = _UFW_STATUS_RE.search(output) if success else None
+            if status_match:
+                if status_match.group(1).lower() == 'active':
                     return {'status': True, 'message': 'UFW firewall is active', 'remediation': ''}
-                elif 'Status: inactive' in output:
+                else:
                     return {'status': False, 'message': 'UFW firewall is inactive', 'remediation': 'Enable UFW firewall: Run "sudo ufw enable" in terminal'}
             
             # Check iptables
-            success, output = self.run_command('iptables -L -n')
+            success, output = self.run_command(['iptables', '-L', '-n']) if tools['iptables'] else (False, '')
             if success:
-                # Check if there are any rules beyond default accept
-                lines = output.strip().split('\n')
-                rule_count = 0
-                for line in lines:
-                    if line.strip() and not line.startswith('Chain') and not line.startswith('target'):
-                        rule_count += 1
-                
-                if rule_count > 0:
+                # Check if there are any rules beyond default accept; stops at the first rule line
+                if _IPTABLES_RULE_RE.search(output):
                     return {'status': True, 'message': 'iptables firewall rules are configured', 'remediation': ''}
                 else:
                     return {'status': False, 'message': 'No iptables firewall rules found', 'remediation': 'Configure iptables firewall: Install and configure UFW ("sudo apt install ufw && sudo ufw enable") or set up iptables rules manually'}
             
             # Check firewalld
-            success, output = self.run_command('firewall-cmd --state')
+            success, output = self.run_command(['firewall-cmd', '--state']) if tools['firewall-cmd'] else (False, '')
             if success:
                 if 'running' in output.lower():
                     return {'status': True, 'message': 'firewalld is running', 'remediation': ''}
@@ -851,19 +1153,12 @@ class SecurityChecker:
     
     def check_disk_encryption(self) -> Dict[str, any]:
         """Check if disk encryption is enabled."""
-        if self.system == 'darwin':
-            return self._check_macos_encryption()
-        elif self.system == 'windows':
-            return self._check_windows_encryption()
-        elif self.system == 'linux':
-            return self._check_linux_encryption()
-        else:
-            return {'status': False, 'message': f'Unsupported platform: {self.system}'}
+        return self._dispatch['encryption']()
     
     def _check_macos_encryption(self) -> Dict[str, any]:
         """Check macOS FileVault encryption."""
         try:
-            success, output = self.run_command('fdesetup status')
+            success, output = self.run_command(['fdesetup', 'status'])
             if success and 'FileVault is On' in output:
                 return {'status': True, 'message': 'FileVault encryption is enabled', 'remediation': ''}
             else:
@@ -874,7 +1169,7 @@ class SecurityChecker:
     def _check_windows_encryption(self) -> Dict[str, any]:
         """Check Windows BitLocker encryption."""
         try:
-            success, output = self.run_command('manage-bde -status')
+            success, output = self.run_command(['manage-bde', '-status'])
             if success:
                 if 'Protection On' in output:
                     return {'status': True, 'message': 'BitLocker encryption is enabled', 'remediation': ''}
@@ -889,15 +1184,20 @@ class SecurityChecker:
         """Check Linux LUKS encryption."""
         try:
             # Check for LUKS encrypted devices
-            success, output = self.run_command('lsblk -o NAME,FSTYPE')
+            success, output = self.run_command(['lsblk', '-o', 'NAME,FSTYPE'])
             if success and 'crypto_LUKS' in output:
                 return {'status': True, 'message': 'LUKS encryption detected', 'remediation': ''}
             
-            # Check for encrypted filesystems in /proc/mounts
-            success, output = self.run_command('cat /proc/mounts')
+            # Check for encrypted filesystems in /proc/mounts (read directly, no need for cat)
+            try:
+                with open('/proc/mounts', 'r') as f:
+                    output = f.read()
+                success = True
+            except OSError:
+                success, output = False, ''
             if success and ('/dev/mapper/' in output or 'dm-' in output):
                 # Check if these are encrypted
-                success, dm_output = self.run_command('dmsetup table')
+                success, dm_output = self.run_command(['dmsetup', 'table'])
                 if success and 'crypt' in dm_output:
                     return {'status': True, 'message': 'Disk encryption detected', 'remediation': ''}
             
@@ -908,23 +1208,16 @@ class SecurityChecker:
     
     def check_autolock(self) -> Dict[str, any]:
         """Check if autolock is configured for 10 minutes or less."""
-        if self.system == 'darwin':
-            return self._check_macos_autolock()
-        elif self.system == 'windows':
-            return self._check_windows_autolock()
-        elif self.system == 'linux':
-            return self._check_linux_autolock()
-        else:
-            return {'status': False, 'message': f'Unsupported platform: {self.system}'}
+        return self._dispatch['autolock']()
     
     def _check_macos_autolock(self) -> Dict[str, any]:
         """Check macOS screen lock timeout."""
         try:
             # Check display sleep timeout using pmset
-            success, output = self.run_command('pmset -g')
+            success, output = self.run_command(['pmset', '-g'])
             if success:
                 # Parse displaysleep setting
-                display_sleep_match = re.search(r'displaysleep\s+(\d+)', output)
+                display_sleep_match = _DISPLAYSLEEP_RE.search(output)
                 if display_sleep_match:
                     display_sleep = int(display_sleep_match.group(1))
                     if display_sleep <= 10:  # 10 minutes
@@ -933,9 +1226,14 @@ class SecurityChecker:
                         return {'status': False, 'message': f'Display sleep timeout too long: {display_sleep} minutes', 'remediation': 'Set display sleep timeout to 10 minutes or less: System Preferences > Energy Saver > Display Sleep'}
             
             # Fallback: check screensaver settings (older macOS versions)
-            success, output = self.run_command('defaults read com.apple.screensaver idleTime')
-            if success:
-                idle_time = int(output)
+            # This is a user-writable preference that cfprefsd may not have
+            # flushed to disk yet, so ask `defaults` first and only read the
+            # (possibly stale) plist directly if that fails
+            success, output = self.run_command(['defaults', 'read', 'com.apple.screensaver', 'idleTime'])
+            idle_time = output if success else self._read_plist_value(
+                os.path.expanduser('~/Library/Preferences/com.apple.screensaver.plist'), 'idleTime')
+            if idle_time is not None:
+                idle_time = int(idle_time)
                 if idle_time <= 600:  # 10 minutes = 600 seconds
                     return {'status': True, 'message': f'Screen saver timeout: {idle_time//60} minutes', 'remediation': ''}
                 else:
@@ -950,9 +1248,9 @@ class SecurityChecker:
         """Check Windows screen lock timeout."""
         try:
             # Check screen saver timeout
-            success, output = self.run_command('reg query "HKEY_CURRENT_USER\\Control Panel\\Desktop" /v ScreenSaveTimeOut')
+            success, output = self.run_command(['reg', 'query', r'HKEY_CURRENT_USER\Control Panel\Desktop', '/v', 'ScreenSaveTimeOut'])
             if success:
-                timeout_match = re.search(r'ScreenSaveTimeOut\s+REG_SZ\s+(\d+)', output)
+                timeout_match = _SCREENSAVE_TIMEOUT_RE.search(output)
                 if timeout_match:
                     timeout = int(timeout_match.group(1))
                     if timeout <= 600:  # 10 minutes = 600 seconds
@@ -961,9 +1259,9 @@ class SecurityChecker:
                         return {'status': False, 'message': f'Screen lock timeout too long: {timeout//60} minutes', 'remediation': 'Set screen lock timeout to 10 minutes or less: Control Panel > Personalization > Screen Saver > Wait'}
             
             # Check power settings
-            success, output = self.run_command('powercfg /query SCHEME_CURRENT SUB_VIDEO VIDEOIDLE')
+            success, output = self.run_command(['powercfg', '/query', 'SCHEME_CURRENT', 'SUB_VIDEO', 'VIDEOIDLE'])
             if success:
-                timeout_match = re.search(r'Current AC Power Setting Index: 0x([a-f0-9]+)', output)
+                timeout_match = _POWERCFG_AC_RE.search(output)
                 if timeout_match:
                     timeout = int(timeout_match.group(1), 16)
                     if timeout > 0 and timeout <= 600:
@@ -978,9 +1276,9 @@ class SecurityChecker:
         """Check Linux screen lock timeout."""
         try:
             # Check GNOME settings
-            success, output = self.run_command('gsettings get org.gnome.desktop.screensaver idle-activation-enabled')
+            success, output = self.run_command(['gsettings', 'get', 'org.gnome.desktop.screensaver', 'idle-activation-enabled'])
             if success and 'true' in output.lower():
-                success, timeout_output = self.run_command('gsettings get org.gnome.desktop.screensaver idle-delay')
+                success, timeout_output = self.run_command(['gsettings', 'get', 'org.gnome.desktop.screensaver', 'idle-delay'])
                 if success:
                     timeout = int(timeout_output.strip())
                     if timeout <= 600:  # 10 minutes = 600 seconds
@@ -992,16 +1290,19 @@ class SecurityChecker:
             kde_config = os.path.expanduser('~/.config/kscreenlockerrc')
             if os.path.exists(kde_config):
                 try:
-                    with open(kde_config, 'r') as f:
-                        content = f.read()
-                        if 'Timeout=' in content:
-                            timeout_match = re.search(r'Timeout=(\d+)', content)
-                            if timeout_match:
-                                timeout = int(timeout_match.group(1))
-                                if timeout <= 10:  # KDE uses minutes
-                                    return {'status': True, 'message': f'Screen lock timeout: {timeout} minutes', 'remediation': ''}
-                                else:
-                                    return {'status': False, 'message': f'Screen lock timeout too long: {timeout} minutes', 'remediation': 'Set screen lock timeout to 10 minutes or less: System Settings > Desktop Behavior > Screen Locking > Lock screen automatically after'}
+                    kde = configparser.ConfigParser(interpolation=None, strict=False)
+                    try:
+                        kde.read(kde_config)
+                        timeout = kde.getint('Daemon', 'Timeout', fallback=None)
+                    except (configparser.Error, ValueError):
+                        with open(kde_config, 'r') as f:
+                            timeout_match = _KDE_TIMEOUT_RE.search(f.read())
+                        timeout = int(timeout_match.group(1)) if timeout_match else None
+                    if timeout is not None:
+                        if timeout <= 10:  # KDE uses minutes
+                            return {'status': True, 'message': f'Screen lock timeout: {timeout} minutes', 'remediation': ''}
+                        else:
+                            return {'status': False, 'message': f'Screen lock timeout too long: {timeout} minutes', 'remediation': 'Set screen lock timeout to 10 minutes or less: System Settings > Desktop Behavior > Screen Locking > Lock screen automatically after'}
                 except:
                     pass
             
@@ -1012,25 +1313,18 @@ class SecurityChecker:
     
     def check_guest_accounts(self) -> Dict[str, any]:
         """Check if guest accounts are disabled."""
-        if self.system == 'darwin':
-            return self._check_macos_guest_accounts()
-        elif self.system == 'windows':
-            return self._check_windows_guest_accounts()
-        elif self.system == 'linux':
-            return self._check_linux_guest_accounts()
-        else:
-            return {'status': False, 'message': f'Unsupported platform: {self.system}'}
+        return self._dispatch['guest_accounts']()
     
     def _check_macos_guest_accounts(self) -> Dict[str, any]:
         """Check macOS guest account status."""
         try:
             # Try to check guest account without sudo first
-            success, output = self.run_command('dscl . -read /Users/Guest')
+            success, output = self.run_command(['dscl', '.', '-read', '/Users/Guest'])
             if success:
                 return {'status': False, 'message': 'Guest account is enabled', 'remediation': 'Disable guest account: System Preferences > Users & Groups > Guest User > Allow guests to log in to this computer (uncheck)'}
             
             # Check if guest account exists in user list (alternative approach)
-            success, output = self.run_command('dscl . -list /Users')
+            success, output = self.run_command(['dscl', '.', '-list', '/Users'])
             if success and 'Guest' in output:
                 return {'status': False, 'message': 'Guest account may be enabled', 'remediation': 'Please verify guest account is disabled: System Preferences > Users & Groups > Guest User'}
             
@@ -1043,7 +1337,7 @@ class SecurityChecker:
     def _check_windows_guest_accounts(self) -> Dict[str, any]:
         """Check Windows guest account status."""
         try:
-            success, output = self.run_command('net user guest')
+            success, output = self.run_command(['net', 'user', 'guest'])
             if success:
                 if 'Account active' in output and 'No' in output:
                     return {'status': True, 'message': 'Guest account is disabled', 'remediation': ''}
@@ -1058,13 +1352,13 @@ class SecurityChecker:
         """Check Linux guest account status."""
         try:
             # Check for guest account in /etc/passwd
-            success, output = self.run_command('getent passwd guest')
+            success, output = self.run_command(['getent', 'passwd', 'guest'])
             if success:
                 # Try to check if account is locked without sudo first
-                success, shadow_output = self.run_command('getent shadow guest')
+                success, shadow_output = self.run_command(['getent', 'shadow', 'guest'])
                 if success and shadow_output:
                     # Can read shadow file without sudo - check if locked
-                    if shadow_output.split(':')[1].startswith('!') or shadow_output.split(':')[1].startswith('*'):
+                    if shadow_output.split(':', 2)[1][:1] in ('!', '*'):
                         return {'status': True, 'message': 'Guest account is locked', 'remediation': ''}
                     else:
                         return {'status': False, 'message': 'Guest account is active', 'remediation': 'Lock guest account: Run "sudo usermod -L guest" or "sudo passwd -l guest" to lock the account'}
@@ -1091,16 +1385,24 @@ class SecurityChecker:
         print("Running BYOD Security Compliance Checks...")
         print("=" * 50)
         
-        self.results['os_firewall'] = self.check_os_firewall()
-        self.results['disk_encryption'] = self.check_disk_encryption()
-        self.results['autolock'] = self.check_autolock()
-        self.results['guest_accounts'] = self.check_guest_accounts()
+        # The checks are independent and mostly wait on subprocesses, so run
+        # them concurrently; results are only stored from this thread
+        checks = {
+            'os_firewall': self.check_os_firewall,
+            'disk_encryption': self.check_disk_encryption,
+            'autolock': self.check_autolock,
+            'guest_accounts': self.check_guest_accounts
+        }
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {key: executor.submit(check) for key, check in checks.items()}
+            for key, future in futures.items():
+                self.results[key] = future.result()
         
         return self.results, user_email
     
     def display_results(self):
         """Display formatted results."""
-        print(f"\nSecurity Compliance Report for {platform.system()} {platform.release()}")
+        print(f"\nSecurity Compliance Report for {self._plat_system} {self._plat_release}")
         print("=" * 60)
         
         checks = [
@@ -1116,11 +1418,9 @@ class SecurityChecker:
         
         for name, key, description in checks:
             result = self.results[key]
-            status = "✓ PASS" if result['status'] else "✗ FAIL"
-            status_color = "\033[92m" if result['status'] else "\033[91m"
-            reset_color = "\033[0m"
+            label = _PASS_LABEL if result['status'] else _FAIL_LABEL
             
-            print(f"{status_color}{status:8}{reset_color} {name:20} {description}")
+            print(f"{label} {name:20} {description}")
             print(f"         {' ' * 20} {result['message']}")
             print()
             
@@ -1130,187 +1430,296 @@ class SecurityChecker:
         
         print("=" * 60)
         if all_passed:
-            print("\033[92m✓ ALL CHECKS PASSED - Device is compliant\033[0m")
+            print(f"{_GREEN}{_MARK_PASS} ALL CHECKS PASSED - Device is compliant{_RESET}")
         else:
-            print("\033[91m✗ SOME CHECKS FAILED - Device is not compliant\033[0m")
+            print(f"{_LIGHT_RED}{_MARK_FAIL} SOME CHECKS FAILED - Device is not compliant{_RESET}")
             
             # Display remediation steps for failed checks
             if failed_checks:
                 print("\n" + "=" * 60)
-                print("\033[93mREMEDIATION STEPS\033[0m")
+                print(f"{_YELLOW}REMEDIATION STEPS{_RESET}")
                 print("=" * 60)
                 
                 for name, result in failed_checks:
                     if result.get('remediation'):
-                        print(f"\n\033[91m✗ {name}\033[0m")
+                        print(f"\n{_LIGHT_RED}{_MARK_FAIL} {name}{_RESET}")
                         print(f"  How to fix: {result['remediation']}")
                         print()
         print()
     
-    def send_to_n8n(self, user_email: str = None) -> bool:
-        """Send security check results to n8n webhook."""
-        if not self.n8n_webhook_url:
-            print("⚠️  No n8n webhook URL configured. Skipping API send.")
-            return False
+    def _webhook_connect(self):
+        """Open the webhook socket if needed, then switch it to the read timeout.
         
-        try:
-            # Get device information
-            device_info = self.get_device_info()
+        The connection object carries the short connect timeout, so only the
+        TCP connect and the TLS handshake are bounded by it; the preceding
+        getaddrinfo lookup is not affected by socket timeouts.
+        """
+        if self._http_conn.sock is None:
+            self._http_conn.connect()
+            self._http_conn.sock.settimeout(_WEBHOOK_READ_TIMEOUT)
+    
+    def _webhook_request(self, method: str, url: str, body: Optional[bytes],
+                         headers: Dict[str, str]) -> Tuple[int, bytes]:
+        """Send an HTTP request and return (status code, raw response body).
+        
+        The connection to the webhook host is kept alive and reused, so the
+        POST -> GET fallbacks in send_to_n8n don't pay for a new TLS handshake.
+        Server errors (500/502/503/504), dropped connections and timeouts are
+        retried with exponential backoff, honouring Retry-After when sent,
+        until _WEBHOOK_DEADLINE. A POST that timed out waiting for the
+        response is not retried, since n8n may already have processed it.
+        """
+        # Only needed for the proxy lookup, so import on first use
+        import urllib.request
+        
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        if self._http_conn is None or self._http_conn_key != key:
+            if self._http_conn is not None:
+                self._http_conn.close()
+            conn_cls = (http.client.HTTPSConnection if parts.scheme == 'https'
+                        else http.client.HTTPConnection)
+            # Honour the usual *_proxy environment variables like urllib did:
+            # https is tunnelled with CONNECT, http is forwarded in absolute form
+            self._http_proxy_headers = None
+            proxy = urllib.request.getproxies().get(parts.scheme)
+            if proxy and not urllib.request.proxy_bypass(parts.hostname or ''):
+                proxy_parts = urllib.parse.urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+                proxy_headers = {}
+                if proxy_parts.username:
+                    credentials = (f"{urllib.parse.unquote(proxy_parts.username)}:"
+                                   f"{urllib.parse.unquote(proxy_parts.password or '')}")
+                    encoded_credentials = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+                    proxy_headers['Proxy-Authorization'] = f'Basic {encoded_credentials}'
+                proxy_port = proxy_parts.port or (443 if proxy_parts.scheme == 'https' else 80)
+                self._http_conn = conn_cls(proxy_parts.hostname, proxy_port, timeout=_WEBHOOK_CONNECT_TIMEOUT)
+                if parts.scheme == 'https':
+                    self._http_conn.set_tunnel(parts.hostname, parts.port, headers=proxy_headers)
+                else:
+                    self._http_proxy_headers = proxy_headers
+            else:
+                self._http_conn = conn_cls(parts.netloc, timeout=_WEBHOOK_CONNECT_TIMEOUT)
+            self._http_conn_key = key
+        
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        if self._http_proxy_headers is not None:
+            # A forwarding proxy needs the absolute URL (and its own auth)
+            path = f"{parts.scheme}://{parts.netloc}{path}"
+            headers = {**headers, **self._http_proxy_headers}
+        
+        deadline = time.monotonic() + _WEBHOOK_DEADLINE
+        for attempt in range(_WEBHOOK_RETRIES + 1):
+            backoff = _WEBHOOK_BACKOFF * 2 ** attempt
+            last_attempt = attempt == _WEBHOOK_RETRIES
+            connected = False
+            try:
+                reused = self._http_conn.sock is not None
+                try:
+                    self._webhook_connect()
+                    connected = True
+                    self._http_conn.request(method, path, body=body, headers=headers)
+                    response = self._http_conn.getresponse()
+                except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                    if not reused:
+                        raise
+                    # The server dropped the idle keep-alive connection; reconnect once
+                    self._http_conn.close()
+                    self._webhook_connect()
+                    self._http_conn.request(method, path, body=body, headers=headers)
+                    response = self._http_conn.getresponse()
+                
+                # Read the whole body so the connection can be reused
+                status_code, response_body = response.status, response.read()
+            except (OSError, http.client.HTTPException) as e:
+                # Connection failure or timeout: start over on a fresh connection
+                self._http_conn.close()
+                read_timeout = connected and isinstance(e, socket.timeout)
+                if (last_attempt or (read_timeout and method == 'POST')
+                        or time.monotonic() + backoff > deadline):
+                    raise
+                time.sleep(backoff)
+                continue
             
-            # Prepare payload
-            payload = {
-                "timestamp": datetime.datetime.now().isoformat(),
-                "user_email": user_email,
-                "device_info": device_info,
-                "system": {
-                    "platform": self._map_platform_name(platform.system()),
-                    "version": platform.release(),
-                    "machine": platform.machine()
-                },
-                "security_checks": self.results,
-                "compliance_status": all(result['status'] for result in self.results.values()),
-                "failed_checks": [key for key, result in self.results.items() if not result['status']],
-                "remediation_needed": [
-                    {
-                        "check": key,
-                        "message": result['message'],
-                        "remediation": result['remediation']
-                    }
-                    for key, result in self.results.items() 
-                    if not result['status'] and result.get('remediation')
-                ]
-            }
+            if status_code not in _WEBHOOK_RETRY_STATUSES or last_attempt:
+                return status_code, response_body
             
-            # Prepare headers
+            # Transient server error: wait as asked, or back off exponentially
+            delay = _retry_after_seconds(response.getheader('Retry-After'), backoff)
+            if time.monotonic() + delay > deadline:
+                return status_code, response_body
+            time.sleep(delay)
+    
+    def close(self):
+        """Close the kept-alive webhook connection, if one is open."""
+        if self._http_conn is not None:
+            self._http_conn.close()
+            self._http_conn = None
+            self._http_conn_key = None
+    
+    def _build_webhook_params(self, user_email: Optional[str]) -> Dict[str, any]:
+        """Build the flattened webhook body from the device info and check results."""
+        # Get device information
+        device_info = self.get_device_info()
+        
+        # Prepare payload
+        payload = {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "user_email": user_email,
+            "device_info": device_info,
+            "system": {
+                "platform": self._map_platform_name(self._plat_system),
+                "version": self._plat_release,
+                "machine": self._plat_machine
+            },
+            "security_checks": self.results,
+            "compliance_status": all(result['status'] for result in self.results.values()),
+            "failed_checks": [key for key, result in self.results.items() if not result['status']],
+            "remediation_needed": [
+                {
+                    "check": key,
+                    "message": result['message'],
+                    "remediation": result['remediation']
+                }
+                for key, result in self.results.items() 
+                if not result['status'] and result.get('remediation')
+            ]
+        }
+        
+        # Flatten the payload into individual parameters for easier n8n processing
+        device = payload['device_info']
+        system_info = payload['system']
+        rn = payload['remediation_needed']
+        remediation_needed = json.dumps(rn, separators=_COMPACT) if rn else ''
+        flat_params = {
+            'timestamp': payload['timestamp'],
+            'run_id': self._run_id,
+            'user_email': payload['user_email'],
+            'compliance_status': payload['compliance_status'],
+            'failed_checks_count': len(payload['failed_checks']),
+            'failed_checks': ','.join(payload['failed_checks']) if payload['failed_checks'] else '',
+            
+            # Device info
+            **{f'device_{key}': device[key] for key in ('brand', 'model', 'serial', 'ram', 'storage')},
+            
+            # System info
+            **{f'system_{key}': system_info[key] for key in ('platform', 'version', 'machine')},
+        }
+        
+        # Security check results
+        for key, prefix in _CHECK_KEYS:
+            check = payload['security_checks'][key]
+            flat_params[f'{prefix}_status'] = check['status']
+            flat_params[f'{prefix}_message'] = check['message']
+            flat_params[f'{prefix}_remediation'] = check['remediation']
+        
+        # Remediation summary
+        flat_params['remediation_needed'] = remediation_needed
+        
+        return flat_params
+    
+    def _webhook_headers(self) -> Dict[str, str]:
+        """Return the webhook request headers, building them (and auth) once."""
+        if self._headers is None:
             headers = {
                 'Content-Type': 'application/json',
-                'User-Agent': 'BYOD-Security-Checker/1.0'
+                'User-Agent': 'BYOD-Security-Checker/1.0',
+                'X-Request-Id': self._run_id
             }
             
             # Add authentication (only if credentials are provided)
-            auth = None
             if self.n8n_username and self.n8n_password:
                 # Use Basic Authentication
-                auth = (self.n8n_username, self.n8n_password)
-                print("🔐 Using Basic Authentication")
+                credentials = f"{self.n8n_username}:{self.n8n_password}"
+                encoded_credentials = base64.b64encode(credentials.encode('utf-8')).decode('utf-8')
+                headers['Authorization'] = f'Basic {encoded_credentials}'
             elif self.api_key:
                 # Use Bearer token
                 headers['Authorization'] = f'Bearer {self.api_key}'
-                print("🔐 Using Bearer Token Authentication")
+            self._headers = headers
+        return self._headers
+    
+    def send_to_n8n(self, user_email: str = None, force_send: bool = False,
+                    messages: Optional[List[str]] = None) -> bool:
+        """Send security check results to n8n webhook.
+        
+        Unless force_send is set, the send is skipped when the results are
+        unchanged since the last successful send. Status messages are
+        written to stdout in one go once the send has finished, or appended
+        to `messages` if a list is passed so the caller can print them later.
+        """
+        if messages is not None:
+            return self._send_to_n8n(user_email, force_send, messages)
+        
+        messages = []
+        try:
+            return self._send_to_n8n(user_email, force_send, messages)
+        finally:
+            _write_lines(messages)
+    
+    def _send_to_n8n(self, user_email: Optional[str], force_send: bool, messages: List[str]) -> bool:
+        """Do the work of send_to_n8n, appending status lines to messages."""
+        if not self.n8n_webhook_url:
+            messages.append(f"{_EMOJI_WARN}  No n8n webhook URL configured. Skipping API send.")
+            return False
+        
+        try:
+            headers = self._webhook_headers()
+            
+            if self.n8n_username and self.n8n_password:
+                messages.append(f"{_EMOJI_LOCKED} Using Basic Authentication")
+            elif self.api_key:
+                messages.append(f"{_EMOJI_LOCKED} Using Bearer Token Authentication")
             else:
-                print("🔓 No authentication (webhook configured with 'Authorization: None')")
+                messages.append(f"{_EMOJI_UNLOCKED} No authentication (webhook configured with 'Authorization: None')")
             
-            print(f"\n📡 Sending results to n8n webhook...")
+            # Build the body only now that it is about to be sent
+            flat_params = self._build_webhook_params(user_email)
             
-            # Flatten the payload into individual parameters for easier n8n processing
-            flat_params = {
-                'timestamp': payload['timestamp'],
-                'user_email': payload['user_email'],
-                'compliance_status': payload['compliance_status'],
-                'failed_checks_count': len(payload['failed_checks']),
-                'failed_checks': ','.join(payload['failed_checks']) if payload['failed_checks'] else '',
-                
-                # Device info
-                'device_brand': payload['device_info']['brand'],
-                'device_model': payload['device_info']['model'],
-                'device_serial': payload['device_info']['serial'],
-                'device_ram': payload['device_info']['ram'],
-                'device_storage': payload['device_info']['storage'],
-                
-                # System info
-                'system_platform': payload['system']['platform'],
-                'system_version': payload['system']['version'],
-                'system_machine': payload['system']['machine'],
-                
-                # Security check results
-                'firewall_status': payload['security_checks']['os_firewall']['status'],
-                'firewall_message': payload['security_checks']['os_firewall']['message'],
-                'firewall_remediation': payload['security_checks']['os_firewall']['remediation'],
-                
-                'encryption_status': payload['security_checks']['disk_encryption']['status'],
-                'encryption_message': payload['security_checks']['disk_encryption']['message'],
-                'encryption_remediation': payload['security_checks']['disk_encryption']['remediation'],
-                
-                'autolock_status': payload['security_checks']['autolock']['status'],
-                'autolock_message': payload['security_checks']['autolock']['message'],
-                'autolock_remediation': payload['security_checks']['autolock']['remediation'],
-                
-                'guest_accounts_status': payload['security_checks']['guest_accounts']['status'],
-                'guest_accounts_message': payload['security_checks']['guest_accounts']['message'],
-                'guest_accounts_remediation': payload['security_checks']['guest_accounts']['remediation'],
-                
-                # Remediation summary
-                'remediation_needed': json.dumps(payload['remediation_needed']) if payload['remediation_needed'] else ''
-            }
+            fingerprint = _payload_fingerprint(self.n8n_webhook_url, flat_params)
+            if not force_send and fingerprint == _read_last_hash():
+                messages.append(f"{_EMOJI_OK} Results unchanged since the last send. Skipping API send (use --force-send to resend).")
+                return True
+            
+            messages.append(f"\n{_EMOJI_SEND} Sending results to n8n webhook...")
             
             # Send as POST request with flattened data in the body
-            try:
-                # Prepare request
-                data = json.dumps(flat_params).encode('utf-8')
-                req = urllib.request.Request(self.n8n_webhook_url, data=data, headers=headers)
-                
-                # Add Basic Auth if provided
-                if auth:
-                    credentials = f"{auth[0]}:{auth[1]}"
-                    encoded_credentials = base64.b64encode(credentials.encode('utf-8')).decode('utf-8')
-                    req.add_header('Authorization', f'Basic {encoded_credentials}')
-                
-                try:
-                    with urllib.request.urlopen(req, timeout=30) as response:
-                        response_text = response.read().decode('utf-8')
-                        status_code = response.getcode()
-                except urllib.error.HTTPError as e:
-                    status_code = e.code
-                    response_text = e.read().decode('utf-8')
-                    
-                    # If POST fails with 404 (not registered), try GET as fallback
-                    if status_code == 404 and "not registered" in response_text:
-                        print("📡 POST not supported, trying GET with query parameters...")
-                        query_string = urllib.parse.urlencode(flat_params)
-                        get_url = f"{self.n8n_webhook_url}?{query_string}"
-                        req = urllib.request.Request(get_url, headers=headers)
-                        
-                        if auth:
-                            req.add_header('Authorization', f'Basic {encoded_credentials}')
-                        
-                        try:
-                            with urllib.request.urlopen(req, timeout=30) as response:
-                                response_text = response.read().decode('utf-8')
-                                status_code = response.getcode()
-                        except urllib.error.HTTPError as e2:
-                            status_code = e2.code
-                            response_text = e2.read().decode('utf-8')
-                            
-                            # If still 404, try simple GET (test webhook behavior)
-                            if status_code == 404 and "not registered" in response_text:
-                                print("📡 Webhook appears to be in test mode, trying simple GET...")
-                                req = urllib.request.Request(self.n8n_webhook_url, headers=headers)
-                                
-                                if auth:
-                                    req.add_header('Authorization', f'Basic {encoded_credentials}')
-                                
-                                try:
-                                    with urllib.request.urlopen(req, timeout=30) as response:
-                                        response_text = response.read().decode('utf-8')
-                                        status_code = response.getcode()
-                                except urllib.error.HTTPError as e3:
-                                    status_code = e3.code
-                                    response_text = e3.read().decode('utf-8')
+            # Prepare request (compact separators keep the body small)
+            data = json.dumps(flat_params, separators=_COMPACT).encode('utf-8')
+            
+            status_code, response_body = self._webhook_request('POST', self.n8n_webhook_url, data, headers)
+            # Only the POST and the parameterised GET carry the results
+            delivered = True
+            
+            # If POST fails with 404 (not registered), try GET as fallback
+            if status_code == 404 and b"not registered" in response_body:
+                messages.append(f"{_EMOJI_SEND} POST not supported, trying GET with query parameters...")
+                query_string = urllib.parse.urlencode(flat_params)
+                get_url = f"{self.n8n_webhook_url}?{query_string}"
+                status_code, response_body = self._webhook_request('GET', get_url, None, headers)
                 
-                if status_code == 200:
-                    print("✅ Successfully sent results to n8n!")
-                    return True
-                else:
-                    print(f"❌ Failed to send to n8n. Status code: {status_code}")
-                    print(f"Response: {response_text}")
-                    return False
-                    
-            except (urllib.error.URLError, urllib.error.HTTPError) as e:
-                print(f"❌ Network error: {str(e)}")
+                # If still 404, try simple GET (test webhook behavior)
+                if status_code == 404 and b"not registered" in response_body:
+                    messages.append(f"{_EMOJI_SEND} Webhook appears to be in test mode, trying simple GET...")
+                    status_code, response_body = self._webhook_request('GET', self.n8n_webhook_url, None, headers)
+                    delivered = False
+            
+            if status_code == 200:
+                if delivered:
+                    _write_last_hash(fingerprint)
+                messages.append(f"{_EMOJI_OK} Successfully sent results to n8n!")
+                return True
+            else:
+                messages.append(f"{_EMOJI_FAIL} Failed to send to n8n. Status code: {status_code}")
+                messages.append(f"Response: {response_body.decode('utf-8', errors='replace')}")
                 return False
-                
+        
+        except (OSError, http.client.HTTPException) as e:
+            messages.append(f"{_EMOJI_FAIL} Network error: {str(e)}")
+            return False
         except Exception as e:
-            print(f"❌ Error sending to n8n: {str(e)}")
+            messages.append(f"{_EMOJI_FAIL} Error sending to n8n: {str(e)}")
             return False
 
 
@@ -1318,7 +1727,14 @@ def main():
     """Main function."""
     import argparse
     
-    parser = argparse.ArgumentParser(description='BYOD Security Compliance Checker')
+    # Emit UTF-8 regardless of the console code page (e.g. cp1252 on Windows)
+    # so the emoji status lines never raise UnicodeEncodeError
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    
+    parser = argparse.ArgumentParser(description='BYOD Security Compliance Checker',
+                                     epilog=_HELP_EPILOG,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('--n8n-webhook', 
                        help='n8n webhook URL to send results to')
     parser.add_argument('--api-key', 
@@ -1331,28 +1747,14 @@ def main():
                        help='Send results to n8n webhook (now enabled by default)')
     parser.add_argument('--no-n8n', action='store_true',
                        help='Disable sending results to n8n (override default behavior)')
-    
-    # Handle help separately to maintain backward compatibility
-    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
-        parser.print_help()
-        print("\nSecurity Checks:")
-        print("  - OS firewall (built-in firewall enabled)")
-        print("  - Disk encryption (FileVault/BitLocker/LUKS)")
-        print("  - Auto-lock timeout (10 minutes or less)")
-        print("  - Guest accounts (disabled)")
-        print("\nAPI Integration:")
-        print("  Results are automatically sent to n8n (saas.group default webhook)")
-        print("  Default: No authentication required (webhook configured with 'Authorization: None')")
-        print("  Use --no-n8n to disable sending to n8n")
-        print("  Override webhook: --n8n-webhook 'https://your-n8n-instance.com/webhook/id'")
-        print("  Add auth if needed: --n8n-username 'user' --n8n-password 'pass'")
-        print("  Or set environment variables: N8N_WEBHOOK_URL, N8N_USERNAME, N8N_PASSWORD")
-        return
+    parser.add_argument('--force-send', action='store_true',
+                       help='Send results to n8n even if unchanged since the last send')
     
     args = parser.parse_args()
     
     # No validation needed since we have default webhook URL and credentials
     
+    checker = None
     try:
         # Initialize checker with n8n configuration
         checker = SecurityChecker(
@@ -1366,12 +1768,30 @@ def main():
         # Run security checks
         results, user_email = checker.run_all_checks()
         
+        # Send to n8n by default unless explicitly disabled. The send runs in
+        # the background while the results are displayed; its status lines
+        # are collected and printed after the report so output doesn't mix.
+        # A daemon thread polled with a short join keeps Ctrl+C responsive
+        # even while a request is in flight.
+        n8n_messages = []
+        n8n_thread = None
+        if checker.n8n_webhook_url and not args.no_n8n:
+            def send():
+                try:
+                    checker.send_to_n8n(user_email, args.force_send, n8n_messages)
+                except Exception as e:
+                    n8n_messages.append(f"{_EMOJI_FAIL} Error sending to n8n: {str(e)}")
+            
+            n8n_thread = threading.Thread(target=send, daemon=True)
+            n8n_thread.start()
+        
         # Display results
         checker.display_results()
         
-        # Send to n8n by default unless explicitly disabled
-        if checker.n8n_webhook_url and not args.no_n8n:
-            checker.send_to_n8n(user_email)
+        if n8n_thread is not None:
+            while n8n_thread.is_alive():
+                n8n_thread.join(0.1)
+        _write_lines(n8n_messages)
             
     except KeyboardInterrupt:
         print("\nCheck interrupted by user")
@@ -1379,6 +1799,9 @@ def main():
     except Exception as e:
         print(f"Error: {str(e)}")
         sys.exit(1)
+    finally:
+        if checker is not None:
+            checker.close()
 
 
 if __name__ == "__main__":